@@ -6,6 +6,7 @@ import multiprocessing as mp
 from pathlib import Path
 
 import imagehash
+import numpy as np
 import yaml
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -68,11 +69,11 @@ class Hashio:
         return str(imagehash.colorhash(img))
 
     def _dhash(self, img) -> str:
-        r, g, b, a = img.split()
-        hash_red = imagehash.dhash(r)
-        hash_green = imagehash.dhash(g)
-        hash_blue = imagehash.dhash(b)
-        return str(hash_red) + str(hash_green) + str(hash_blue)
+        # same result as imagehash.dhash on each of the r/g/b channels, concatenated,
+        # but resizes the image once and diffs all three channels together
+        pixels = np.asarray(img.convert("RGB").resize((9, 8), Image.LANCZOS))
+        diff = pixels[:, 1:, :] > pixels[:, :-1, :]
+        return np.packbits(diff.transpose(2, 0, 1)).tobytes().hex()
 
     def _phash(self, img) -> str:
         return str(imagehash.phash(img))
@@ -438,8 +438,10 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
                 num_pts=200,
             )
 
-            style.marker.symbol = MarkerSymbolEnum.CIRCLE
-            self._add_legend_handle_marker(legend_label, style.marker)
+            legend_marker = style.marker.model_copy(
+                update={"symbol": MarkerSymbolEnum.CIRCLE.value}
+            )
+            self._add_legend_handle_marker(legend_label, legend_marker)
 
             if label:
                 self.text(
@@ -753,8 +755,10 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
                     gid="moon-marker",
                 )
 
-            style.marker.symbol = MarkerSymbolEnum.CIRCLE
-            self._add_legend_handle_marker(legend_label, style.marker)
+            legend_marker = style.marker.model_copy(
+                update={"symbol": MarkerSymbolEnum.CIRCLE.value}
+            )
+            self._add_legend_handle_marker(legend_label, legend_marker)
 
             if label:
                 self.text(
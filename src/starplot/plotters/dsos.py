@@ -222,8 +222,10 @@ class DsoPlotterMixin:
             if style is None:
                 continue
 
-            _alpha_fn = alpha_fn or (lambda d: style.marker.alpha)
-            style.marker.alpha = _alpha_fn(_dso)
+            if alpha_fn:
+                # copy instead of mutating, so the plot's DSO style isn't changed
+                marker = style.marker.model_copy(update={"alpha": alpha_fn(_dso)})
+                style = style.model_copy(update={"marker": marker})
 
             if _dso.pk not in label_pks:
                 label = None
@@ -71,6 +71,20 @@ class StarPlotterMixin:
         _bayer = []
         _flamsteed = []
 
+        # stars are usually sized by magnitude bins, so each distinct marker size only needs one
+        # offset label style (which also lets the labels share the style's cached matplotlib kwargs)
+        label_styles = {}
+
+        def label_style(base_style, star_size):
+            key = (id(base_style), star_size)
+            if key not in label_styles:
+                label_styles[key] = base_style.offset_from_marker(
+                    marker_symbol=style.marker.symbol,
+                    marker_size=star_size,
+                    scale=self.scale,
+                )
+            return label_styles[key]
+
         # Plot all star common names first
         for i, s in enumerate(star_objects):
             if s.pk not in label_pks:
@@ -97,11 +111,7 @@ class StarPlotterMixin:
                     label,
                     s.ra,
                     s.dec,
-                    style=style.label.offset_from_marker(
-                        marker_symbol=style.marker.symbol,
-                        marker_size=star_sizes[i],
-                        scale=self.scale,
-                    ),
+                    style=label_style(style.label, star_sizes[i]),
                     collision_handler=collision_handler,
                     gid="stars-label-name",
                 )
@@ -118,11 +128,7 @@ class StarPlotterMixin:
                 bayer_desig,
                 ra,
                 dec,
-                style=self.style.bayer_labels.offset_from_marker(
-                    marker_symbol=style.marker.symbol,
-                    marker_size=star_size,
-                    scale=self.scale,
-                ),
+                style=label_style(self.style.bayer_labels, star_size),
                 collision_handler=collision_handler,
                 gid="stars-label-bayer",
             )
@@ -132,11 +138,7 @@ class StarPlotterMixin:
                 flamsteed_num,
                 ra,
                 dec,
-                style=self.style.flamsteed_labels.offset_from_marker(
-                    marker_symbol=style.marker.symbol,
-                    marker_size=star_size,
-                    scale=self.scale,
-                ),
+                style=label_style(self.style.flamsteed_labels, star_size),
                 collision_handler=collision_handler,
                 gid="stars-label-flamsteed",
             )
@@ -1,5 +1,6 @@
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 import rtree
@@ -39,6 +40,29 @@ def round_away_from_zero(x):
     return math.ceil(x) if x > 0 else math.floor(x)
 
 
+DEFAULT_ANCHOR_FALLBACKS = (
+    AnchorPointEnum.BOTTOM_RIGHT,
+    AnchorPointEnum.TOP_LEFT,
+    AnchorPointEnum.TOP_RIGHT,
+    AnchorPointEnum.BOTTOM_LEFT,
+    AnchorPointEnum.BOTTOM_CENTER,
+    AnchorPointEnum.TOP_CENTER,
+    AnchorPointEnum.RIGHT_CENTER,
+    AnchorPointEnum.LEFT_CENTER,
+)
+"""Default anchor point fallbacks for collision handlers (each handler gets its own list)"""
+
+
+@lru_cache(maxsize=32)
+def _anchor_alignments(anchor_points: tuple) -> tuple[tuple[str, str], ...]:
+    """Returns the matplotlib (va, ha) alignments of anchor points, cached because every label tries the same fallbacks"""
+    alignments = []
+    for a in anchor_points:
+        d = AnchorPointEnum.from_str(a).as_matplot()
+        alignments.append((d["va"], d["ha"]))
+    return tuple(alignments)
+
+
 @dataclass
 class CollisionHandler:
     """
@@ -87,16 +111,7 @@ class CollisionHandler:
     """
 
     def __post_init__(self):
-        self.anchor_fallbacks = self.anchor_fallbacks or [
-            AnchorPointEnum.BOTTOM_RIGHT,
-            AnchorPointEnum.TOP_LEFT,
-            AnchorPointEnum.TOP_RIGHT,
-            AnchorPointEnum.BOTTOM_LEFT,
-            AnchorPointEnum.BOTTOM_CENTER,
-            AnchorPointEnum.TOP_CENTER,
-            AnchorPointEnum.RIGHT_CENTER,
-            AnchorPointEnum.LEFT_CENTER,
-        ]
+        self.anchor_fallbacks = self.anchor_fallbacks or list(DEFAULT_ANCHOR_FALLBACKS)
 
 
 class TextPlotterMixin:
@@ -254,9 +269,7 @@ class TextPlotterMixin:
         display_x, display_y = self.ax.transData.transform(data_xy)
 
         anchors = [(original_va, original_ha)]
-        for a in collision_handler.anchor_fallbacks:
-            d = AnchorPointEnum.from_str(a).as_matplot()
-            anchors.append((d["va"], d["ha"]))
+        anchors.extend(_anchor_alignments(tuple(collision_handler.anchor_fallbacks)))
 
         for va, ha in anchors:
             attempts += 1
@@ -502,15 +515,15 @@ class TextPlotterMixin:
         if not text:
             return
 
-        style = style.model_copy()  # need a copy because we possibly mutate it below
-
         collision_handler = collision_handler or self.collision_handler
 
-        if style.offset_x == "auto":
-            style.offset_x = 0
-
-        if style.offset_y == "auto":
-            style.offset_y = 0
+        if style.offset_x == "auto" or style.offset_y == "auto":
+            style = style.model_copy(
+                update={
+                    "offset_x": 0 if style.offset_x == "auto" else style.offset_x,
+                    "offset_y": 0 if style.offset_y == "auto" else style.offset_y,
+                }
+            )
 
         if kwargs.get("area"):
             label = self._text_area(
@@ -1,19 +1,21 @@
-import json
-
+from copy import deepcopy
 from enum import Enum
+from functools import lru_cache, wraps
+from math import sqrt
 from pathlib import Path
-from typing import Optional, Union
+from typing import ClassVar, Optional, Union
 
 import yaml
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticCustomError
 from pydantic.color import Color
 from pydantic.functional_serializers import PlainSerializer
+from pydantic.functional_validators import WrapValidator
 from matplotlib import patheffects
 from typing_extensions import Annotated
 
 from starplot.models.dso import DsoType
-from starplot.styles.helpers import merge_dict
 from starplot.styles.markers import (
     ellipse,
     circle_cross,
@@ -24,10 +26,35 @@ from starplot.styles.markers import (
 )
 
 
+@lru_cache(maxsize=1024)
+def _as_hex(color: Color) -> str:
+    """Returns the color as a hex string, cached because styles format the same few colors over and over"""
+    return color.as_hex()
+
+
+@lru_cache(maxsize=256)
+def _stroke(linewidth: float, foreground: str) -> patheffects.withStroke:
+    """Returns a stroke path effect, cached because it's shared by all styles with the same border"""
+    return patheffects.withStroke(linewidth=linewidth, foreground=foreground)
+
+
+@lru_cache(maxsize=1024)
+def _parse_color(value: str) -> Color:
+    return Color(value)
+
+
+def _validate_color(value, handler):
+    """Parses color strings with the interned `_parse_color` cache instead of pydantic's Color validation"""
+    if isinstance(value, str):
+        return _parse_color(value)
+    return handler(value)
+
+
 ColorStr = Annotated[
     Color,
+    WrapValidator(_validate_color),
     PlainSerializer(
-        lambda c: c.as_hex() if c and c != "none" else None,
+        lambda c: _as_hex(c) if c and c != "none" else None,
         return_type=str,
     ),
 ]
@@ -39,7 +66,48 @@ PI = 3.141592653589793
 SQR_2 = 1.41421356237
 
 
+_KWARGS_CACHE = "_kwargs_cache"
+
+
+def _copy_containers(value):
+    """Returns a copy of the value's (nested) dicts and lists, sharing everything else"""
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+
+def _cached_kwargs(method):
+    """
+    Caches the kwargs built by a style method for the last scale it was called with, per style
+    instance. Each call returns a copy of the cached dict and any dicts/lists nested in it
+    (e.g. `path_effects`), so callers can modify it. Other values, like the path effects
+    themselves, are shared. The cache is cleared when the style is changed or copied.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, scale: float = 1.0) -> dict:
+        cache = self.__dict__.get(_KWARGS_CACHE)
+        if cache is None:
+            cache = self.__dict__[_KWARGS_CACHE] = {}
+
+        cached = cache.get(name)
+        if cached is None or cached[0] != scale:
+            cached = cache[name] = (scale, method(self, scale))
+
+        return {
+            k: _copy_containers(v) if isinstance(v, (dict, list)) else v
+            for k, v in cached[1].items()
+        }
+
+    return wrapper
+
+
 class BaseStyle(BaseModel):
+    # Styles must be hashable: pydantic only copies defaults that are unhashable, so every
+    # PlotStyle() shares the nested style defaults. extend() copies them before changing anything.
     __hash__ = object.__hash__
 
     class Config:
@@ -47,6 +115,16 @@ class BaseStyle(BaseModel):
         use_enum_values = True
         validate_assignment = True
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__pydantic_fields__:
+            self.__dict__.pop(_KWARGS_CACHE, None)
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        style = super().model_copy(update=update, deep=deep)
+        style.__dict__.pop(_KWARGS_CACHE, None)
+        return style
+
     def __enter__(self):
         self._original = self.model_copy(deep=True)
         return self
@@ -56,6 +134,54 @@ class BaseStyle(BaseModel):
             original_value = getattr(self._original, field_name)
             setattr(self, field_name, original_value)
 
+    def _copy_styles(self) -> "BaseStyle":
+        """Returns a copy of the style, its nested styles and any mutable (list/dict) field values"""
+        style = self.model_copy()
+        for field_name in self.__pydantic_fields__.keys():
+            value = style.__dict__[field_name]
+            if isinstance(value, BaseStyle):
+                style.__dict__[field_name] = value._copy_styles()
+            elif isinstance(value, (list, dict)):
+                style.__dict__[field_name] = deepcopy(value)
+        return style
+
+    def _apply_overrides(self, overrides: dict) -> None:
+        """
+        Applies a dict of style overrides in place, validating only the overridden values.
+
+        All invalid values are reported together in one ValidationError, with their full path from this style.
+        """
+        errors = self._override_errors(overrides, ())
+        if errors:
+            raise ValidationError.from_exception_data(type(self).__name__, errors)
+
+    def _override_errors(self, overrides: dict, loc: tuple) -> list[dict]:
+        """Applies the overrides that are valid, and returns the errors of the ones that aren't"""
+        errors = []
+        for key, value in overrides.items():
+            if key not in self.__pydantic_fields__:
+                errors.append(
+                    {"type": "extra_forbidden", "loc": loc + (key,), "input": value}
+                )
+                continue
+
+            current = self.__dict__[key]
+            if isinstance(current, BaseStyle) and isinstance(value, dict):
+                errors.extend(current._override_errors(value, loc + (key,)))
+                continue
+
+            try:
+                setattr(self, key, value)
+            except ValidationError as e:
+                for error in e.errors():
+                    error["loc"] = loc + error["loc"]
+                    if "url" not in error:
+                        # custom errors (e.g. from pydantic's Color) are not built-in error types
+                        error["type"] = PydanticCustomError(error["type"], error["msg"])
+                    errors.append(error)
+
+        return errors
+
 
 class GradientDirection(str, Enum):
     LINEAR = "linear"
@@ -100,17 +226,20 @@ class FontWeightEnum(int, Enum):
 
     def as_matplot(self) -> str:
         """Returns the font weight as a matplotlib string, which avoids a bug with integer font weights and rendering text as elements in SVG."""
-        return {
-            FontWeightEnum.THIN: "ultralight",
-            FontWeightEnum.EXTRA_LIGHT: "light",  # matplotlib maps 'light' to 200, which is really extra light
-            # FontWeightEnum.LIGHT: "light",
-            FontWeightEnum.NORMAL: "normal",
-            FontWeightEnum.MEDIUM: "medium",
-            FontWeightEnum.SEMI_BOLD: "semibold",
-            FontWeightEnum.BOLD: "bold",
-            FontWeightEnum.EXTRA_BOLD: "extra bold",
-            FontWeightEnum.HEAVY: "black",
-        }[self.value]
+        return _FONT_WEIGHTS_MATPLOT[self]
+
+
+_FONT_WEIGHTS_MATPLOT = {
+    FontWeightEnum.THIN: "ultralight",
+    FontWeightEnum.EXTRA_LIGHT: "light",  # matplotlib maps 'light' to 200, which is really extra light
+    # FontWeightEnum.LIGHT: "light",
+    FontWeightEnum.NORMAL: "normal",
+    FontWeightEnum.MEDIUM: "medium",
+    FontWeightEnum.SEMI_BOLD: "semibold",
+    FontWeightEnum.BOLD: "bold",
+    FontWeightEnum.EXTRA_BOLD: "extra bold",
+    FontWeightEnum.HEAVY: "black",
+}
 
 
 class FontStyleEnum(str, Enum):
@@ -183,28 +312,32 @@ class MarkerSymbolEnum(str, Enum):
 
     def as_matplot(self) -> str:
         """Returns the matplotlib value of this marker"""
-        return {
-            MarkerSymbolEnum.POINT: ".",
-            MarkerSymbolEnum.CIRCLE: "o",
-            MarkerSymbolEnum.SQUARE: "s",
-            MarkerSymbolEnum.PLUS: "P",
-            MarkerSymbolEnum.SQUARE_STRIPES_DIAGONAL: "$\u25A8$",
-            MarkerSymbolEnum.STAR: "*",
-            MarkerSymbolEnum.SUN: "$\u263C$",
-            MarkerSymbolEnum.DIAMOND: "D",
-            MarkerSymbolEnum.TRIANGLE: "^",
-            MarkerSymbolEnum.CIRCLE_PLUS: "$\u2295$",
-            MarkerSymbolEnum.CIRCLE_CROSS: circle_cross(),
-            MarkerSymbolEnum.CIRCLE_CROSSHAIR: circle_crosshair(),
-            MarkerSymbolEnum.CIRCLE_DOT: circle_dot(),
-            MarkerSymbolEnum.CIRCLE_DOTTED_EDGE: "$\u25CC$",
-            MarkerSymbolEnum.CIRCLE_DOTTED_RINGS: circle_dotted_rings(),
-            MarkerSymbolEnum.CIRCLE_LINE: circle_line(),
-            MarkerSymbolEnum.COMET: "$\u2604$",
-            MarkerSymbolEnum.STAR_4: "$\u2726$",
-            MarkerSymbolEnum.STAR_8: "$\u2734$",
-            MarkerSymbolEnum.ELLIPSE: ellipse(),
-        }[self.value]
+        return _MARKER_SYMBOLS_MATPLOT[self]
+
+
+# built once, because some of the markers are custom paths that are expensive to create
+_MARKER_SYMBOLS_MATPLOT = {
+    MarkerSymbolEnum.POINT: ".",
+    MarkerSymbolEnum.CIRCLE: "o",
+    MarkerSymbolEnum.SQUARE: "s",
+    MarkerSymbolEnum.PLUS: "P",
+    MarkerSymbolEnum.SQUARE_STRIPES_DIAGONAL: "$\u25A8$",
+    MarkerSymbolEnum.STAR: "*",
+    MarkerSymbolEnum.SUN: "$\u263C$",
+    MarkerSymbolEnum.DIAMOND: "D",
+    MarkerSymbolEnum.TRIANGLE: "^",
+    MarkerSymbolEnum.CIRCLE_PLUS: "$\u2295$",
+    MarkerSymbolEnum.CIRCLE_CROSS: circle_cross(),
+    MarkerSymbolEnum.CIRCLE_CROSSHAIR: circle_crosshair(),
+    MarkerSymbolEnum.CIRCLE_DOT: circle_dot(),
+    MarkerSymbolEnum.CIRCLE_DOTTED_EDGE: "$\u25CC$",
+    MarkerSymbolEnum.CIRCLE_DOTTED_RINGS: circle_dotted_rings(),
+    MarkerSymbolEnum.CIRCLE_LINE: circle_line(),
+    MarkerSymbolEnum.COMET: "$\u2604$",
+    MarkerSymbolEnum.STAR_4: "$\u2726$",
+    MarkerSymbolEnum.STAR_8: "$\u2734$",
+    MarkerSymbolEnum.ELLIPSE: ellipse(),
+}
 
 
 class LineStyleEnum(str, Enum):
@@ -259,42 +392,28 @@ class AnchorPointEnum(str, Enum):
     BOTTOM_CENTER = "bottom center"
 
     def as_matplot(self) -> dict:
-        style = {}
-        # the values below look wrong, but they're inverted because the map coords are inverted
-        if self.value == AnchorPointEnum.BOTTOM_LEFT:
-            style["va"] = "top"
-            style["ha"] = "right"
-        elif self.value == AnchorPointEnum.BOTTOM_RIGHT:
-            style["va"] = "top"
-            style["ha"] = "left"
-        elif self.value == AnchorPointEnum.BOTTOM_CENTER:
-            style["va"] = "top"
-            style["ha"] = "center"
-        elif self.value == AnchorPointEnum.TOP_LEFT:
-            style["va"] = "bottom"
-            style["ha"] = "right"
-        elif self.value == AnchorPointEnum.TOP_RIGHT:
-            style["va"] = "bottom"
-            style["ha"] = "left"
-        elif self.value == AnchorPointEnum.TOP_CENTER:
-            style["va"] = "bottom"
-            style["ha"] = "center"
-        elif self.value == AnchorPointEnum.CENTER:
-            style["va"] = "center"
-            style["ha"] = "center"
-        elif self.value == AnchorPointEnum.LEFT_CENTER:
-            style["va"] = "center"
-            style["ha"] = "right"
-        elif self.value == AnchorPointEnum.RIGHT_CENTER:
-            style["va"] = "center"
-            style["ha"] = "left"
-
-        return style
+        return dict(_ANCHOR_POINTS_MATPLOT[self])
 
     @staticmethod
     def from_str(value: str) -> "AnchorPointEnum":
-        options = {ap.value: ap for ap in AnchorPointEnum}
-        return options.get(value)
+        return _ANCHOR_POINTS_BY_VALUE.get(value)
+
+
+_ANCHOR_POINTS_BY_VALUE = {ap.value: ap for ap in AnchorPointEnum}
+
+
+# the values below look wrong, but they're inverted because the map coords are inverted
+_ANCHOR_POINTS_MATPLOT = {
+    AnchorPointEnum.BOTTOM_LEFT: {"va": "top", "ha": "right"},
+    AnchorPointEnum.BOTTOM_RIGHT: {"va": "top", "ha": "left"},
+    AnchorPointEnum.BOTTOM_CENTER: {"va": "top", "ha": "center"},
+    AnchorPointEnum.TOP_LEFT: {"va": "bottom", "ha": "right"},
+    AnchorPointEnum.TOP_RIGHT: {"va": "bottom", "ha": "left"},
+    AnchorPointEnum.TOP_CENTER: {"va": "bottom", "ha": "center"},
+    AnchorPointEnum.CENTER: {"va": "center", "ha": "center"},
+    AnchorPointEnum.LEFT_CENTER: {"va": "center", "ha": "right"},
+    AnchorPointEnum.RIGHT_CENTER: {"va": "center", "ha": "left"},
+}
 
 
 class AlignmentEnum(str, Enum):
@@ -329,10 +448,10 @@ class MarkerStyle(BaseStyle):
     Styling properties for markers.
     """
 
-    color: Optional[ColorStr] = ColorStr("#000")
+    color: Optional[ColorStr] = _parse_color("#000")
     """Fill color of marker. Can be a hex, rgb, hsl, or word string."""
 
-    edge_color: Optional[ColorStr] = ColorStr("#000")
+    edge_color: Optional[ColorStr] = _parse_color("#000")
     """Edge color of marker. Can be a hex, rgb, hsl, or word string."""
 
     edge_width: float = 1
@@ -361,19 +480,21 @@ class MarkerStyle(BaseStyle):
 
     @property
     def symbol_matplot(self) -> str:
-        return MarkerSymbolEnum(self.symbol).as_matplot()
+        return _MARKER_SYMBOLS_MATPLOT[self.symbol]
 
+    @_cached_kwargs
     def matplot_kwargs(self, scale: float = 1.0) -> dict:
         return dict(
-            color=self.color.as_hex() if self.color else "none",
-            markeredgecolor=self.edge_color.as_hex() if self.edge_color else "none",
-            marker=MarkerSymbolEnum(self.symbol).as_matplot(),
+            color=_as_hex(self.color) if self.color else "none",
+            markeredgecolor=_as_hex(self.edge_color) if self.edge_color else "none",
+            marker=self.symbol_matplot,
             markersize=self.size * scale,
             fillstyle=self.fill,
             alpha=self.alpha,
             zorder=self.zorder,
         )
 
+    @_cached_kwargs
     def matplot_scatter_kwargs(self, scale: float = 1.0) -> dict:
         plot_kwargs = self.matplot_kwargs(scale)
         plot_kwargs["edgecolors"] = plot_kwargs.pop("markeredgecolor")
@@ -392,9 +513,10 @@ class MarkerStyle(BaseStyle):
         return plot_kwargs
 
     def to_polygon_style(self):
-        return PolygonStyle(
-            fill_color=self.color.as_hex() if self.color else None,
-            edge_color=self.edge_color.as_hex() if self.edge_color else None,
+        # all values are already validated, so skip validating them again
+        return PolygonStyle.model_construct(
+            fill_color=self.color,
+            edge_color=self.edge_color,
             edge_width=self.edge_width,
             alpha=self.alpha,
             zorder=self.zorder,
@@ -410,7 +532,7 @@ class LineStyle(BaseStyle):
     width: float = 4
     """Width of line in points"""
 
-    color: ColorStr = ColorStr("#000")
+    color: ColorStr = _parse_color("#000")
     """Color of the line. Can be a hex, rgb, hsl, or word string."""
 
     style: Union[LineStyleEnum, tuple] = LineStyleEnum.SOLID
@@ -431,11 +553,12 @@ class LineStyle(BaseStyle):
     edge_color: Optional[ColorStr] = None
     """Edge color of the line. _If the width or color is falsey then the line will NOT be drawn with an edge._"""
 
+    @_cached_kwargs
     def matplot_kwargs(self, scale: float = 1.0) -> dict:
         line_width = self.width * scale
 
         result = dict(
-            color=self.color.as_hex(),
+            color=_as_hex(self.color),
             linestyle=self.style,
             linewidth=line_width,
             # dash_capstyle=self.dash_capstyle,
@@ -445,14 +568,15 @@ class LineStyle(BaseStyle):
 
         if self.edge_width and self.edge_color:
             result["path_effects"] = [
-                patheffects.withStroke(
-                    linewidth=line_width + 2 * self.edge_width * scale,
-                    foreground=self.edge_color.as_hex(),
+                _stroke(
+                    line_width + 2 * self.edge_width * scale,
+                    _as_hex(self.edge_color),
                 )
             ]
 
         return result
 
+    @_cached_kwargs
     def matplot_line_collection_kwargs(self, scale: float = 1.0) -> dict:
         plot_kwargs = self.matplot_kwargs(scale)
         plot_kwargs["linewidths"] = plot_kwargs.pop("linewidth")
@@ -486,10 +610,11 @@ class PolygonStyle(BaseStyle):
     zorder: int = -1
     """Zorder of the polygon"""
 
+    @_cached_kwargs
     def matplot_kwargs(self, scale: float = 1.0) -> dict:
         styles = dict(
-            edgecolor=self.edge_color.as_hex() if self.edge_color else "none",
-            facecolor=self.fill_color.as_hex() if self.fill_color else "none",
+            edgecolor=_as_hex(self.edge_color) if self.edge_color else "none",
+            facecolor=_as_hex(self.fill_color) if self.fill_color else "none",
             fill=True if self.fill_color or self.color else False,
             linewidth=self.edge_width * scale,
             linestyle=self.line_style,
@@ -498,19 +623,19 @@ class PolygonStyle(BaseStyle):
             capstyle="round",
         )
         if self.color:
-            styles["color"] = self.color.as_hex()
+            styles["color"] = _as_hex(self.color)
 
         return styles
 
     def to_marker_style(self, symbol: MarkerSymbolEnum):
-        color = self.color.as_hex() if self.color else None
-        fill_color = self.fill_color.as_hex() if self.fill_color else None
-        fill_style = FillStyleEnum.FULL if color or fill_color else FillStyleEnum.NONE
-        return MarkerStyle(
-            symbol=symbol,
-            color=color or fill_color,
-            fill=fill_style,
-            edge_color=self.edge_color.as_hex() if self.edge_color else None,
+        color = self.color or self.fill_color
+        fill_style = FillStyleEnum.FULL if color else FillStyleEnum.NONE
+        # all values are already validated, so skip validating them again
+        return MarkerStyle.model_construct(
+            symbol=MarkerSymbolEnum(symbol).value,
+            color=color,
+            fill=fill_style.value,
+            edge_color=self.edge_color,
             edge_width=self.edge_width,
             alpha=self.alpha,
             zorder=self.zorder,
@@ -557,7 +682,7 @@ class LabelStyle(BaseStyle):
     font_weight: FontWeightEnum = FontWeightEnum.NORMAL
     """Font weight (e.g. normal, bold, ultra bold, etc)"""
 
-    font_color: ColorStr = ColorStr("#000")
+    font_color: ColorStr = _parse_color("#000")
     """Font's color"""
 
     font_alpha: float = 1
@@ -606,13 +731,14 @@ class LabelStyle(BaseStyle):
     zorder: int = ZOrderEnum.LAYER_4
     """Zorder of the label"""
 
+    @_cached_kwargs
     def matplot_kwargs(self, scale: float = 1.0) -> dict:
         style = dict(
-            color=self.font_color.as_hex(),
+            color=_as_hex(self.font_color),
             fontsize=self.font_size * scale,
             fontstyle=self.font_style,
             fontname=self.font_name,
-            weight=FontWeightEnum(self.font_weight).as_matplot(),
+            weight=_FONT_WEIGHTS_MATPLOT[self.font_weight],
             alpha=self.font_alpha,
             zorder=self.zorder,
         )
@@ -624,13 +750,10 @@ class LabelStyle(BaseStyle):
 
         if self.border_width != 0 and self.border_color is not None:
             style["path_effects"] = [
-                patheffects.withStroke(
-                    linewidth=self.border_width * scale,
-                    foreground=self.border_color.as_hex(),
-                )
+                _stroke(self.border_width * scale, _as_hex(self.border_color))
             ]
 
-        style.update(AnchorPointEnum(self.anchor_point).as_matplot())
+        style.update(_ANCHOR_POINTS_MATPLOT[self.anchor_point])
 
         return style
 
@@ -640,16 +763,14 @@ class LabelStyle(BaseStyle):
         if self.offset_x != "auto" or self.offset_y != "auto":
             return self
 
-        new_style = self.model_copy()
+        x_direction = -1 if self.anchor_point.endswith("left") else 1
+        y_direction = -1 if self.anchor_point.startswith("bottom") else 1
 
-        x_direction = -1 if new_style.anchor_point.endswith("left") else 1
-        y_direction = -1 if new_style.anchor_point.startswith("bottom") else 1
-
-        offset = (marker_size**0.5 / 2) / scale
+        offset = (sqrt(marker_size) / 2) / scale
 
         # matplotlib seems to use marker size differently depending on symbol (for scatter)
         # it is NOT strictly the area of the bounding box of the marker
-        if marker_symbol in [MarkerSymbolEnum.POINT]:
+        if marker_symbol == MarkerSymbolEnum.POINT:
             offset /= PI
 
         elif marker_symbol != MarkerSymbolEnum.SQUARE:
@@ -657,10 +778,14 @@ class LabelStyle(BaseStyle):
             offset *= scale
 
         offset += 0.65
-        new_style.offset_x = offset * float(x_direction)
-        new_style.offset_y = offset * float(y_direction)
 
-        return new_style
+        # offsets are plain floats, so the copy doesn't need to be validated
+        return self.model_copy(
+            update={
+                "offset_x": offset * x_direction,
+                "offset_y": offset * y_direction,
+            }
+        )
 
 
 class ObjectStyle(BaseStyle):
@@ -692,7 +817,7 @@ class LegendStyle(BaseStyle):
     location: LegendLocationEnum = LegendLocationEnum.INSIDE_BOTTOM_RIGHT
     """Location of the legend, relative to the map area (inside or outside)"""
 
-    background_color: ColorStr = ColorStr("#fff")
+    background_color: ColorStr = _parse_color("#fff")
     """Background color of the legend box"""
 
     background_alpha: float = 1.0
@@ -722,7 +847,7 @@ class LegendStyle(BaseStyle):
     symbol_padding: float = 0.2
     """Padding between each symbol and its label"""
 
-    border_color: ColorStr = ColorStr("#c5c5c5")
+    border_color: ColorStr = _parse_color("#c5c5c5")
     """Border color of the legend box"""
 
     border_padding: float = 1.28
@@ -737,7 +862,7 @@ class LegendStyle(BaseStyle):
     font_weight: FontWeightEnum = FontWeightEnum.NORMAL
     """Font weight of the legend labels"""
 
-    font_color: ColorStr = ColorStr("#000")
+    font_color: ColorStr = _parse_color("#000")
     """Font color for legend labels"""
 
     title_font_size: int = 36
@@ -752,6 +877,7 @@ class LegendStyle(BaseStyle):
     zorder: int = ZOrderEnum.LAYER_5
     """Zorder of the legend"""
 
+    @_cached_kwargs
     def matplot_kwargs(self, scale: float = 1.0) -> dict:
         return dict(
             loc=self.location,
@@ -762,29 +888,81 @@ class LegendStyle(BaseStyle):
                 "weight": FontWeightEnum(self.font_weight),
                 "size": self.font_size * scale,
             },
-            labelcolor=self.font_color.as_hex(),
+            labelcolor=_as_hex(self.font_color),
             borderpad=self.border_padding,
             labelspacing=self.label_padding,
             handletextpad=self.symbol_padding,
             mode="expand" if self.expand else None,
-            facecolor=self.background_color.as_hex(),
+            facecolor=_as_hex(self.background_color),
             title_fontproperties=dict(
                 weight=self.title_font_weight,
                 size=self.title_font_size,
                 family=self.title_font_name.split(","),
             ),
             alignment=self.alignment,
-            edgecolor=self.border_color.as_hex(),
+            edgecolor=_as_hex(self.border_color),
             borderaxespad=self.padding,
         )
 
 
+_AUTO_OFFSET = dict(offset_x="auto", offset_y="auto")
+"""Label kwargs for automatically offsetting the label from its marker"""
+
+
+def _dso_style(
+    symbol: MarkerSymbolEnum, label: LabelStyle = None, **marker_kwargs
+) -> ObjectStyle:
+    """Returns a default DSO style: a filled marker just below stars, with an auto-offset label"""
+    marker_kwargs = {
+        "fill": FillStyleEnum.FULL,
+        "zorder": ZOrderEnum.LAYER_3 - 1,
+        **marker_kwargs,
+    }
+    if label is None:
+        label = LabelStyle(**_AUTO_OFFSET)
+
+    return ObjectStyle(
+        marker=MarkerStyle(symbol=symbol, **marker_kwargs),
+        label=label,
+    )
+
+
 class PlotStyle(BaseStyle):
     """
     Defines the styling for a plot
     """
 
-    background_color: list[tuple[float, str]] | ColorStr = ColorStr("#fff")
+    _DSO_STYLE_ATTRS: ClassVar[dict[DsoType, str]] = {
+        # Star Clusters ----------
+        DsoType.OPEN_CLUSTER: "dso_open_cluster",
+        DsoType.GLOBULAR_CLUSTER: "dso_globular_cluster",
+        # Galaxies ----------
+        DsoType.GALAXY: "dso_galaxy",
+        DsoType.GALAXY_PAIR: "dso_galaxy",
+        DsoType.GALAXY_TRIPLET: "dso_galaxy",
+        DsoType.GROUP_OF_GALAXIES: "dso_galaxy",
+        # Nebulas ----------
+        DsoType.NEBULA: "dso_nebula",
+        DsoType.PLANETARY_NEBULA: "dso_planetary_nebula",
+        DsoType.EMISSION_NEBULA: "dso_nebula",
+        DsoType.STAR_CLUSTER_NEBULA: "dso_nebula",
+        DsoType.REFLECTION_NEBULA: "dso_nebula",
+        DsoType.HII_IONIZED_REGION: "dso_nebula",
+        # Stars ----------
+        DsoType.STAR: "star",
+        DsoType.DOUBLE_STAR: "dso_double_star",
+        DsoType.ASSOCIATION_OF_STARS: "dso_association_stars",
+        # Others ----------
+        DsoType.DARK_NEBULA: "dso_dark_nebula",
+        DsoType.SUPERNOVA_REMNANT: "dso_supernova_remnant",
+        DsoType.NOVA_STAR: "dso_nova_star",
+        DsoType.NONEXISTENT: "dso_nonexistant",
+        DsoType.UNKNOWN: "dso_unknown",
+        DsoType.DUPLICATE_RECORD: "dso_duplicate",
+    }
+    """Style attribute for each DSO type"""
+
+    background_color: list[tuple[float, str]] | ColorStr = _parse_color("#fff")
     """
     Background color of the map region.
 
@@ -807,19 +985,19 @@ class PlotStyle(BaseStyle):
     **Gradient backgrounds are not yet supported for optic plots that use a camera.**
     """
 
-    figure_background_color: ColorStr = ColorStr("#fff")
+    figure_background_color: ColorStr = _parse_color("#fff")
 
     text_border_width: int = 2
     """Text border (aka halos) width. This will apply to _all_ text labels on the plot. If you'd like to control these borders by object type, then set this global width to `0` and refer to the label style's `border_width` and `border_color` properties."""
 
-    text_border_color: ColorStr = ColorStr("#fff")
+    text_border_color: ColorStr = _parse_color("#fff")
 
     # Borders
     border_font_size: int = 18
     border_font_weight: FontWeightEnum = FontWeightEnum.BOLD
-    border_font_color: ColorStr = ColorStr("#000")
-    border_line_color: ColorStr = ColorStr("#000")
-    border_bg_color: ColorStr = ColorStr("#fff")
+    border_font_color: ColorStr = _parse_color("#000")
+    border_line_color: ColorStr = _parse_color("#000")
+    border_bg_color: ColorStr = _parse_color("#fff")
 
     # Title
     title: LabelStyle = LabelStyle(
@@ -853,8 +1031,7 @@ class PlotStyle(BaseStyle):
             font_size=24,
             font_weight=FontWeightEnum.BOLD,
             zorder=ZOrderEnum.LAYER_3 + 2,
-            offset_x="auto",
-            offset_y="auto",
+            **_AUTO_OFFSET,
         ),
     )
     """Styling for stars *(see [`ObjectStyle`][starplot.styles.ObjectStyle])*"""
@@ -865,8 +1042,7 @@ class PlotStyle(BaseStyle):
         font_name="GFS Didot",
         zorder=ZOrderEnum.LAYER_4,
         anchor_point=AnchorPointEnum.TOP_LEFT,
-        offset_x="auto",
-        offset_y="auto",
+        **_AUTO_OFFSET,
     )
     """Styling for Bayer labels of stars"""
 
@@ -875,8 +1051,7 @@ class PlotStyle(BaseStyle):
         font_weight=FontWeightEnum.NORMAL,
         zorder=ZOrderEnum.LAYER_4,
         anchor_point=AnchorPointEnum.BOTTOM_LEFT,
-        offset_x="auto",
-        offset_y="auto",
+        **_AUTO_OFFSET,
     )
     """Styling for Flamsteed number labels of stars"""
 
@@ -891,8 +1066,7 @@ class PlotStyle(BaseStyle):
         label=LabelStyle(
             font_size=28,
             font_weight=FontWeightEnum.BOLD,
-            offset_x="auto",
-            offset_y="auto",
+            **_AUTO_OFFSET,
         ),
     )
     """Styling for planets"""
@@ -909,8 +1083,7 @@ class PlotStyle(BaseStyle):
         label=LabelStyle(
             font_size=28,
             font_weight=FontWeightEnum.BOLD,
-            offset_x="auto",
-            offset_y="auto",
+            **_AUTO_OFFSET,
         ),
     )
     """Styling for the moon"""
@@ -931,148 +1104,93 @@ class PlotStyle(BaseStyle):
     """Styling for the Sun"""
 
     # Deep Sky Objects (DSOs)
-    dso_open_cluster: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.CIRCLE,
-            fill=FillStyleEnum.FULL,
-            line_style=(0, (1, 2)),
-            edge_width=1.3,
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
-        label=LabelStyle(offset_x="auto", offset_y="auto"),
+    dso_open_cluster: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.CIRCLE,
+        line_style=(0, (1, 2)),
+        edge_width=1.3,
     )
     """Styling for open star clusters"""
 
-    dso_association_stars: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.CIRCLE,
-            fill=FillStyleEnum.FULL,
-            line_style=(0, (1, 2)),
-            edge_width=1.3,
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
-        label=LabelStyle(offset_x="auto", offset_y="auto"),
+    dso_association_stars: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.CIRCLE,
+        line_style=(0, (1, 2)),
+        edge_width=1.3,
     )
     """Styling for associations of stars"""
 
-    dso_globular_cluster: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.CIRCLE_CROSS,
-            fill=FillStyleEnum.FULL,
-            color="#555",
-            alpha=0.8,
-            edge_width=1.2,
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
-        label=LabelStyle(offset_x="auto", offset_y="auto"),
+    dso_globular_cluster: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.CIRCLE_CROSS,
+        color="#555",
+        alpha=0.8,
+        edge_width=1.2,
     )
     """Styling for globular star clusters"""
 
-    dso_galaxy: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.ELLIPSE,
-            fill=FillStyleEnum.FULL,
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
-        label=LabelStyle(offset_x="auto", offset_y="auto"),
-    )
+    dso_galaxy: ObjectStyle = _dso_style(MarkerSymbolEnum.ELLIPSE)
     """Styling for galaxies"""
 
-    dso_nebula: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.SQUARE,
-            fill=FillStyleEnum.FULL,
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
-        label=LabelStyle(offset_x="auto", offset_y="auto"),
-    )
+    dso_nebula: ObjectStyle = _dso_style(MarkerSymbolEnum.SQUARE)
     """Styling for nebulas"""
 
-    dso_planetary_nebula: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.CIRCLE_CROSSHAIR,
-            fill=FillStyleEnum.FULL,
-            edge_width=1.6,
-            size=26,
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
-        label=LabelStyle(offset_x="auto", offset_y="auto"),
+    dso_planetary_nebula: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.CIRCLE_CROSSHAIR,
+        edge_width=1.6,
+        size=26,
     )
     """Styling for planetary nebulas"""
 
-    dso_double_star: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.CIRCLE_LINE,
-            fill=FillStyleEnum.TOP,
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
+    dso_double_star: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.CIRCLE_LINE,
         label=LabelStyle(offset_x=1, offset_y=-1),
+        fill=FillStyleEnum.TOP,
     )
     """Styling for double stars"""
 
-    dso_dark_nebula: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.SQUARE,
-            fill=FillStyleEnum.TOP,
-            color="#000",
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
+    dso_dark_nebula: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.SQUARE,
         label=LabelStyle(),
+        fill=FillStyleEnum.TOP,
+        color="#000",
     )
     """Styling for dark nebulas"""
 
-    dso_supernova_remnant: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.SQUARE,
-            fill=FillStyleEnum.TOP,
-            color="#000",
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
+    dso_supernova_remnant: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.SQUARE,
         label=LabelStyle(),
+        fill=FillStyleEnum.TOP,
+        color="#000",
     )
     """Styling for supernova remnants"""
 
-    dso_nova_star: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.SQUARE,
-            fill=FillStyleEnum.TOP,
-            color="#000",
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
+    dso_nova_star: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.SQUARE,
         label=LabelStyle(),
+        fill=FillStyleEnum.TOP,
+        color="#000",
     )
     """Styling for nova stars"""
 
-    dso_nonexistant: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.SQUARE,
-            fill=FillStyleEnum.TOP,
-            color="#000",
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
+    dso_nonexistant: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.SQUARE,
         label=LabelStyle(),
+        fill=FillStyleEnum.TOP,
+        color="#000",
     )
     """Styling for 'nonexistent' (as designated by OpenNGC) deep sky objects"""
 
-    dso_unknown: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.SQUARE,
-            fill=FillStyleEnum.TOP,
-            color="#000",
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
+    dso_unknown: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.SQUARE,
         label=LabelStyle(),
+        fill=FillStyleEnum.TOP,
+        color="#000",
     )
     """Styling for 'unknown' (as designated by OpenNGC) types of deep sky objects"""
 
-    dso_duplicate: ObjectStyle = ObjectStyle(
-        marker=MarkerStyle(
-            symbol=MarkerSymbolEnum.SQUARE,
-            fill=FillStyleEnum.TOP,
-            color="#000",
-            zorder=ZOrderEnum.LAYER_3 - 1,
-        ),
+    dso_duplicate: ObjectStyle = _dso_style(
+        MarkerSymbolEnum.SQUARE,
         label=LabelStyle(),
+        fill=FillStyleEnum.TOP,
+        color="#000",
     )
     """Styling for 'duplicate record' (as designated by OpenNGC) types of deep sky objects"""
 
@@ -1220,35 +1338,8 @@ class PlotStyle(BaseStyle):
 
     def get_dso_style(self, dso_type: DsoType):
         """Returns the style for a DSO type"""
-        styles_by_type = {
-            # Star Clusters ----------
-            DsoType.OPEN_CLUSTER: self.dso_open_cluster,
-            DsoType.GLOBULAR_CLUSTER: self.dso_globular_cluster,
-            # Galaxies ----------
-            DsoType.GALAXY: self.dso_galaxy,
-            DsoType.GALAXY_PAIR: self.dso_galaxy,
-            DsoType.GALAXY_TRIPLET: self.dso_galaxy,
-            DsoType.GROUP_OF_GALAXIES: self.dso_galaxy,
-            # Nebulas ----------
-            DsoType.NEBULA: self.dso_nebula,
-            DsoType.PLANETARY_NEBULA: self.dso_planetary_nebula,
-            DsoType.EMISSION_NEBULA: self.dso_nebula,
-            DsoType.STAR_CLUSTER_NEBULA: self.dso_nebula,
-            DsoType.REFLECTION_NEBULA: self.dso_nebula,
-            DsoType.HII_IONIZED_REGION: self.dso_nebula,
-            # Stars ----------
-            DsoType.STAR: self.star,
-            DsoType.DOUBLE_STAR: self.dso_double_star,
-            DsoType.ASSOCIATION_OF_STARS: self.dso_association_stars,
-            # Others ----------
-            DsoType.DARK_NEBULA: self.dso_dark_nebula,
-            DsoType.SUPERNOVA_REMNANT: self.dso_supernova_remnant,
-            DsoType.NOVA_STAR: self.dso_nova_star,
-            DsoType.NONEXISTENT: self.dso_nonexistant,
-            DsoType.UNKNOWN: self.dso_unknown,
-            DsoType.DUPLICATE_RECORD: self.dso_duplicate,
-        }
-        return styles_by_type.get(dso_type)
+        style_attr = self._DSO_STYLE_ATTRS.get(dso_type)
+        return getattr(self, style_attr) if style_attr else None
 
     @staticmethod
     def load_from_file(filename: str) -> "PlotStyle":
@@ -1263,9 +1354,10 @@ class PlotStyle(BaseStyle):
         Returns:
             PlotStyle: A new instance of a PlotStyle
         """
-        with open(filename, "r") as sfile:
-            style = yaml.safe_load(sfile)
-            return PlotStyle().extend(style)
+        path = Path(filename).resolve()
+        stat = path.stat()
+        # the cached style is shared, so return a copy that's safe to modify
+        return _load_style_file(path, stat.st_mtime_ns, stat.st_size)._copy_styles()
 
     def dump_to_file(self, filename: str) -> None:
         """
@@ -1275,8 +1367,7 @@ class PlotStyle(BaseStyle):
             filename: Filename of style file
         """
         with open(filename, "w") as outfile:
-            style_json = self.model_dump_json()
-            style_yaml = yaml.dump(json.loads(style_json))
+            style_yaml = yaml.dump(self.model_dump(mode="json"))
             outfile.write(style_yaml)
 
     def extend(self, *args, **kwargs) -> "PlotStyle":
@@ -1309,13 +1400,20 @@ class PlotStyle(BaseStyle):
         Returns:
             PlotStyle: A new instance of a PlotStyle
         """
-        style_json = self.model_dump_json()
-        style_dict = json.loads(style_json)
+        style = self._copy_styles()
         for a in args:
             if not isinstance(a, dict):
                 raise TypeError("Style overrides must be dictionary types.")
-            merge_dict(style_dict, a)
-        return PlotStyle.parse_obj(style_dict)
+            style._apply_overrides(a)
+        return style
 
     def has_gradient_background(self):
         return isinstance(self.background_color, list)
+
+
+@lru_cache(maxsize=32)
+def _load_style_file(path: Path, mtime_ns: int, size: int) -> PlotStyle:
+    """Loads a style file, cached by path, modified time and size so changed files are loaded again"""
+    with open(path, "r") as sfile:
+        style = yaml.safe_load(sfile)
+        return PlotStyle().extend(style)
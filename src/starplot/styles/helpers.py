@@ -1,6 +1,4 @@
-import json
-
-from functools import wraps
+from functools import lru_cache, wraps
 
 
 def merge_dict(dict_1: dict, dict_2: dict) -> None:
@@ -20,11 +18,35 @@ def merge_dict(dict_1: dict, dict_2: dict) -> None:
             dict_1[k] = dict_2[k]
 
 
+def _override_style(base_style, overrides: dict):
+    """
+    Returns a copy of the base style with the overrides applied, only validating the overridden values.
+
+    Invalid overrides raise a ValidationError with their path from the base style (e.g. `marker.size`).
+    """
+    style = base_style._copy_styles()
+    style._apply_overrides(overrides)
+    return style
+
+
+@lru_cache(maxsize=512)
+def _style_kwarg_path(kwarg: str) -> tuple[str, ...]:
+    """Returns the attribute path of a style kwarg, e.g. `style__marker__size` -> `("marker", "size")`"""
+    return tuple(kwarg.split("__")[1:])
+
+
 def use_style(style_class, style_attr: str = None):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             style = kwargs.get("style")
+
+            if style is None and not any(kw.startswith("style__") for kw in kwargs):
+                # most calls don't override the style, so just pass the base style (if any)
+                if style_attr is not None:
+                    kwargs["style"] = getattr(args[0].style, style_attr, None)
+                return func(*args, **kwargs)
+
             style_kwargs = {
                 kw: value for kw, value in kwargs.items() if kw.startswith("style__")
             }
@@ -37,12 +59,8 @@ def use_style(style_class, style_attr: str = None):
             if style and isinstance(style, dict):
                 if style_attr is not None:
                     # if style is a dict and there's a base style, then we just want to merge the changes
-                    base_style = getattr(args[0].style, style_attr).model_dump_json()
-                    base_style = json.loads(base_style)
-
-                    merge_dict(base_style, style)
-
-                    kwargs["style"] = style_class(**base_style)
+                    base_style = getattr(args[0].style, style_attr)
+                    kwargs["style"] = _override_style(base_style, style)
                 else:
                     kwargs["style"] = style_class(**style)
 
@@ -51,19 +69,13 @@ def use_style(style_class, style_attr: str = None):
                 styling_overrides = {}
                 for key, val in style_kwargs.items():
                     t = styling_overrides
-                    prev = None
-                    for part in key.split("__")[1:]:
-                        if prev is not None:
-                            t = t.setdefault(prev, {})
-                        prev = part
-                    t.setdefault(prev, val)
+                    *parents, attr = _style_kwarg_path(key)
+                    for part in parents:
+                        t = t.setdefault(part, {})
+                    t.setdefault(attr, val)
                 if style_attr is not None:
-                    base_style = getattr(args[0].style, style_attr).model_dump_json()
-                    base_style = json.loads(base_style)
-
-                    merge_dict(base_style, styling_overrides)
-
-                    kwargs["style"] = style_class(**base_style)
+                    base_style = getattr(args[0].style, style_attr)
+                    kwargs["style"] = _override_style(base_style, styling_overrides)
                 else:
                     kwargs["style"] = style_class(**styling_overrides)
 
@@ -74,10 +86,6 @@ def use_style(style_class, style_attr: str = None):
                     if not kw.startswith("style__")
                 }
 
-            elif style is None and style_attr is not None:
-                # if no style overrides and there's a base style, then just pass the base style
-                kwargs["style"] = getattr(args[0].style, style_attr, None)
-
             return func(*args, **kwargs)
 
         return wrapper
@@ -6,6 +6,8 @@ from pytz import timezone
 
 from starplot import Star, MapPlot, Mercator, Miller, Observer, _
 
+from .utils import TEST_RESOLUTION
+
 
 def test_map_radec_invalid():
     with pytest.raises(ValueError, match="ra_min must be less than ra_max"):
@@ -15,6 +17,7 @@ def test_map_radec_invalid():
             ra_max=8,
             dec_min=-16,
             dec_max=24,
+            resolution=TEST_RESOLUTION,
         )
 
     with pytest.raises(ValueError, match="dec_min must be less than dec_max"):
@@ -24,6 +27,7 @@ def test_map_radec_invalid():
             ra_max=24,
             dec_min=50,
             dec_max=24,
+            resolution=TEST_RESOLUTION,
         )
 
 
@@ -55,6 +59,7 @@ def test_map_objects_list_planets():
         dec_min=-40,
         dec_max=40,
         observer=Observer(dt=dt),
+        resolution=TEST_RESOLUTION,
     )
     p.planets()
     p.sun()
@@ -70,7 +75,7 @@ def test_map_objects_list_planets():
 
 
 def test_marker_no_label():
-    p = MapPlot(projection=Mercator())
+    p = MapPlot(projection=Mercator(), resolution=TEST_RESOLUTION)
     p.marker(ra=150, dec=0, style__marker__color="blue")
 
 
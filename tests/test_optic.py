@@ -2,6 +2,8 @@ import pytest
 
 from starplot import Binoculars, Camera, OpticPlot, Observer, styles
 
+from .utils import TEST_RESOLUTION
+
 
 def test_optic_plot_raises_fov_too_big():
     with pytest.raises(ValueError, match=r"Field of View too big"):
@@ -16,6 +18,7 @@ def test_optic_plot_raises_fov_too_big():
                 magnification=2,
                 fov=100,
             ),
+            resolution=TEST_RESOLUTION,
         )
 
 
@@ -34,6 +37,7 @@ def test_optic_plot_raises_on_below_horizon():
                 magnification=10,
                 fov=65,
             ),
+            resolution=TEST_RESOLUTION,
         )
 
 
@@ -54,6 +58,7 @@ def test_optic_plot_raises_gradient_on_camera():
                 sensor_width=35,
             ),
             style=styles.PlotStyle().extend(styles.extensions.GRADIENT_PRE_DAWN),
+            resolution=TEST_RESOLUTION,
         )
 
 
@@ -70,4 +75,5 @@ def test_optic_plot_allows_gradient_on_non_camera():
             fov=65,
         ),
         style=styles.PlotStyle().extend(styles.extensions.GRADIENT_PRE_DAWN),
+        resolution=TEST_RESOLUTION,
     )
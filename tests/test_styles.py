@@ -1,10 +1,25 @@
+import os
+
 import pytest
 
 from pydantic import ValidationError
 from pydantic.color import Color
 
 from starplot import MapPlot, Miller
-from starplot.styles import PlotStyle, FontWeightEnum, LineStyle, LineStyleEnum
+from starplot.models.dso import DsoType
+from starplot.styles import (
+    PlotStyle,
+    AnchorPointEnum,
+    FontWeightEnum,
+    LabelStyle,
+    LegendStyle,
+    LineStyle,
+    LineStyleEnum,
+    ObjectStyle,
+    use_style,
+)
+
+from .utils import TEST_RESOLUTION
 
 
 @pytest.mark.parametrize(
@@ -42,6 +57,23 @@ def test_plot_style_invalid(kwargs):
         PlotStyle(**kwargs)
 
 
+def test_plot_style_extend_invalid():
+    with pytest.raises(ValidationError) as e:
+        PlotStyle().extend(
+            {
+                "star": {"marker": {"bogus": 1, "size": "big"}},
+                "dso_unknown": {"label": {"font_weight": 3}},
+            }
+        )
+
+    assert e.value.title == "PlotStyle"
+    assert [error["loc"] for error in e.value.errors()] == [
+        ("star", "marker", "bogus"),
+        ("star", "marker", "size"),
+        ("dso_unknown", "label", "font_weight"),
+    ]
+
+
 def test_style_enums_use_strings():
     line_style = LineStyle(style=LineStyleEnum.DASHED)
     assert line_style.style == "dashed"
@@ -50,7 +82,11 @@ def test_style_enums_use_strings():
 def test_style_context_manager():
     # GIVEN a font size of 128 for open cluster labels
     style = {"dso_open_cluster": {"label": {"font_size": 128}}}
-    p = MapPlot(projection=Miller(), style=PlotStyle().extend(style))
+    p = MapPlot(
+        projection=Miller(),
+        style=PlotStyle().extend(style),
+        resolution=TEST_RESOLUTION,
+    )
 
     assert p.style.dso_open_cluster.label.font_size == 128
 
@@ -62,3 +98,167 @@ def test_style_context_manager():
 
     # AND when I exit the context manager, it should revert to the original style
     assert p.style.dso_open_cluster.label.font_size == 128
+
+
+def test_plot_style_changes_do_not_leak():
+    # GIVEN an extended style
+    style = PlotStyle().extend({"dso_dark_nebula": {"marker": {"alpha": 0.1}}})
+    assert style.dso_dark_nebula.marker.alpha == 0.1
+
+    # THEN the override should not change other DSO types or new styles
+    assert style.dso_unknown.marker.alpha != 0.1
+    assert PlotStyle().dso_dark_nebula.marker.alpha != 0.1
+
+    # WHEN I change the extended style in place
+    style.dso_dark_nebula.marker.alpha = 0.2
+    style.legend.font_size = 99
+
+    # THEN other DSO types and new styles should not change either
+    assert style.dso_duplicate.marker.alpha != 0.2
+    assert PlotStyle().dso_dark_nebula.marker.alpha != 0.2
+    assert PlotStyle().legend.font_size != 99
+
+
+def test_plot_style_extend_copies_gradients():
+    # GIVEN a style with a gradient background, and an extension of it
+    style = PlotStyle().extend({"background_color": [(0.0, "#000"), (1.0, "#fff")]})
+    extended = style.extend({})
+
+    # WHEN I change the extension's gradient in place
+    extended.background_color[0] = (0.0, "#123")
+    extended.background_color.append((0.5, "#f00"))
+
+    # THEN the original style's gradient should not change
+    assert len(style.background_color) == 2
+    assert style.background_color[0] == (0.0, "#000")
+
+
+def test_get_dso_style():
+    style = PlotStyle().extend({"dso_galaxy": {"marker": {"size": 40}}})
+
+    assert style.get_dso_style(DsoType.GALAXY_PAIR) is style.dso_galaxy
+    assert style.get_dso_style(DsoType.GALAXY_PAIR).marker.size == 40
+    assert style.get_dso_style(DsoType.HII_IONIZED_REGION) is style.dso_nebula
+    assert style.get_dso_style("invalid") is None
+
+
+def test_matplot_kwargs_cache():
+    style = LineStyle(width=2, color="#f00")
+    kwargs = style.matplot_kwargs(scale=2)
+    assert kwargs["linewidth"] == 4
+
+    kwargs["linewidth"] = 99
+    assert style.matplot_kwargs(scale=2)["linewidth"] == 4
+
+    style.width = 3
+    assert style.matplot_kwargs(scale=2)["linewidth"] == 6
+
+    assert style.matplot_kwargs(scale=1)["linewidth"] == 3
+    assert style.matplot_kwargs(scale=2)["linewidth"] == 6
+
+    style_copy = style.model_copy()
+    style_copy.color = "#00f"
+    assert style_copy.matplot_kwargs(scale=2)["color"] == "#00f"
+    assert style.matplot_kwargs(scale=2)["color"] == "#f00"
+
+    with style:
+        style.width = 10
+        assert style.matplot_kwargs(scale=2)["linewidth"] == 20
+    assert style.matplot_kwargs(scale=2)["linewidth"] == 6
+
+
+def test_matplot_kwargs_cache_nested_values():
+    style = LegendStyle()
+    kwargs = style.matplot_kwargs(scale=2)
+    kwargs["prop"]["size"] = 999
+    kwargs["title_fontproperties"]["family"].append("bogus")
+    assert style.matplot_kwargs(scale=2)["prop"]["size"] == style.font_size * 2
+    assert (
+        "bogus" not in style.matplot_kwargs(scale=2)["title_fontproperties"]["family"]
+    )
+
+    style = LabelStyle(border_width=2, border_color="#000")
+    kwargs = style.matplot_kwargs()
+    kwargs["path_effects"].clear()
+    assert len(style.matplot_kwargs()["path_effects"]) == 1
+
+
+@pytest.mark.parametrize(
+    "anchor_point,expected",
+    [
+        (AnchorPointEnum.BOTTOM_RIGHT, {"va": "top", "ha": "left"}),
+        (AnchorPointEnum.TOP_LEFT, {"va": "bottom", "ha": "right"}),
+        (AnchorPointEnum.CENTER, {"va": "center", "ha": "center"}),
+    ],
+)
+def test_anchor_point_as_matplot(anchor_point, expected):
+    assert anchor_point.as_matplot() == expected
+
+    kwargs = LabelStyle(anchor_point=anchor_point).matplot_kwargs()
+    assert kwargs["va"] == expected["va"]
+    assert kwargs["ha"] == expected["ha"]
+
+
+def test_load_from_file(tmp_path):
+    style_path = tmp_path / "style.yml"
+    style_path.write_text("star:\n  marker:\n    size: 10\n")
+
+    style = PlotStyle.load_from_file(style_path)
+    assert style.star.marker.size == 10
+
+    style.star.marker.size = 50
+    assert PlotStyle.load_from_file(style_path).star.marker.size == 10
+
+    # a rewrite within the same mtime tick should still be loaded again
+    mtime_ns = style_path.stat().st_mtime_ns
+    style_path.write_text("star:\n  marker:\n    size: 200\n")
+    os.utime(style_path, ns=(mtime_ns, mtime_ns))
+    assert PlotStyle.load_from_file(style_path).star.marker.size == 200
+
+
+def test_load_from_file_copies_gradients(tmp_path):
+    style_path = tmp_path / "style.yml"
+    style_path.write_text("background_color:\n  - [0.0, '#000']\n  - [1.0, '#fff']\n")
+
+    style = PlotStyle.load_from_file(style_path)
+    style.background_color.append((0.5, "#f00"))
+
+    assert len(PlotStyle.load_from_file(style_path).background_color) == 2
+
+
+def test_use_style_overrides():
+    class Plot:
+        style = PlotStyle()
+
+        @use_style(ObjectStyle, "star")
+        def plot(self, style: ObjectStyle = None, **kwargs):
+            return style, kwargs
+
+    plot = Plot()
+    base_style = plot.style.star
+
+    style, _ = plot.plot()
+    assert style is base_style
+
+    style, _ = plot.plot(style={"marker": {"size": 99}})
+    assert style.marker.size == 99
+    assert base_style.marker.size != 99
+
+    style, kwargs = plot.plot(style__marker__color="#f00", style__label__font_size=3)
+    assert style.marker.color.as_hex() == "#f00"
+    assert style.label.font_size == 3
+    assert base_style.label.font_size != 3
+    assert kwargs == {}
+
+    with pytest.raises(ValidationError) as e:
+        plot.plot(style={"marker": {"size": "big"}})
+    assert e.value.title == "ObjectStyle"
+    assert e.value.errors()[0]["loc"] == ("marker", "size")
+
+    with pytest.raises(ValidationError) as e:
+        plot.plot(style__marker__size="big", style__label__bogus=1)
+    assert e.value.title == "ObjectStyle"
+    assert [error["loc"] for error in e.value.errors()] == [
+        ("marker", "size"),
+        ("label", "bogus"),
+    ]
@@ -8,6 +8,9 @@ from PIL import Image
 
 TEST_DATA_PATH = Path(__file__).resolve().parent / "data"
 
+TEST_RESOLUTION = 1000
+"""Resolution for plots in tests that don't depend on the rendered output (much faster to create than the default)"""
+
 
 def assert_hashes_equal(filename_1, filename_2):
     """Use two hash algorithms to assert files are equal"""